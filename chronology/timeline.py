@@ -1,12 +1,16 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Callable
-from itertools import count
 from .event import Event
 
 if TYPE_CHECKING:
     from typing import Callable
 
 
+def _default_format(day: int) -> str:
+    """Format a day count as the default date `str`."""
+    return f"{day} days have elapsed."
+
+
 class Timeline:
     """Represents a series of days and related sequences of Events.
     
@@ -23,22 +27,21 @@ class Timeline:
         as a nested list. An index without any recorded Events will be None.
 
     """
-    __default_format = lambda x: f"{x} days have elapsed."
-
     def __init__(self) -> None:
-        self.__count = count()
-        self.__format = __class__.__default_format
-        self.__value = next(self.__count)
+        self.__format = _default_format
+        self.__value = 0
+        self.__cached_day = -1
+        self.__cached_date = None
         self.event = []
         
     
     def __setitem__(self, key: int, item: Event | list[Event]) -> None:
-        item_type = type(item)
-        
-        if item_type in {Event, list}:
-            self.event[key] = item if item_type == list else [item]
+        if isinstance(item, list):
+            self.event[key] = item
+        elif isinstance(item, Event):
+            self.event[key] = [item]
         else:
-            error = f"`{item_type}` items cannot be added to the Timeline."
+            error = f"`{type(item)}` items cannot be added to the Timeline."
             
             raise TypeError(error)
 
@@ -49,7 +52,11 @@ class Timeline:
     @property
     def date(self) -> str:
         """Return date as stylized `str`."""
-        return self.__format(self.__value)
+        if self.__cached_day != self.__value:
+            self.__cached_date = self.__format(self.__value)
+            self.__cached_day = self.__value
+
+        return self.__cached_date
     
     @property
     def day(self) -> int:
@@ -69,9 +76,11 @@ class Timeline:
         None
 
         """
-        for _ in range(days):
-            self.__value = next(self.__count)
-            self.event.append(None)
+        if days <= 0:
+            return
+
+        self.__value += days
+        self.event += [None] * days
 
     def set_format(self, format_method: Callable | None) -> None:
         """Set a new method for subsequent date formatting.
@@ -89,6 +98,8 @@ class Timeline:
 
         """
         if format_method is None:
-            self.__format = __class__.__default_format
+            self.__format = _default_format
         else:
             self.__format = format_method
+
+        self.__cached_day = -1
@@ -1,2 +1,2 @@
 from .cosmology import Cosmology
-from .element import Luminary
+from .element import Luminary, LuminaryTable
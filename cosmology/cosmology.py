@@ -1,12 +1,8 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
-from numpy import absolute, append, array
-from numpy.random import default_rng, random_sample
-from scipy.stats import skewnorm
-from cosmology.element import Luminary
-
-if TYPE_CHECKING:
-    from numpy import ndarray
+from secrets import randbits
+from numpy import absolute, array, empty, sqrt
+from numpy.random import default_rng
+from cosmology.element import LuminaryTable
 
 class Cosmology:
     """
@@ -23,16 +19,17 @@ class Cosmology:
     seed : int
         The integer seed used for this instance and its members.
 
-    luminary : list[Luminary]
-        The Luminary instances important to this Cosmology.
+    luminary : LuminaryTable
+        The Luminaries important to this Cosmology. Indexing it returns
+        individual Luminary instances.
     
-    number : ndarray[int]
+    number : list[int]
         Numbers with some irreal significance to this Cosmology.
     
     """
     def __init__(self, seed: int | None = None) -> None:
         if seed is None:
-            self.__seed = int(random_sample(size=1)[0] * (2**32 - 1))
+            self.__seed = randbits(32)
         else:
             self.__seed = seed
         
@@ -48,18 +45,24 @@ class Cosmology:
             self.number
         )
     
-    def __generate_luminaries(self) -> list[Luminary]:
-        """Generate a list of Luminary objects."""
+    def __generate_luminaries(self) -> LuminaryTable:
+        """Generate a table of Luminaries."""
         n, scale = self.rng.integers(4, 16, 2)
 
-        # Appending a {0, 1} values to stand-in for Sol, Earth respectively.
-        dist = skewnorm.rvs(2, size=n, scale=scale, random_state=self.rng)
-        dist = append(dist, [0.00])
+        # Skew-normal (a=2) draw via delta * |u| + sqrt(1 - delta^2) * v.
+        delta = 2 / sqrt(5)
+        u, v = self.rng.standard_normal((2, n))
+        dist = empty(n + 2)
+        dist[:n] = scale * (delta * absolute(u) + sqrt(1 - delta * delta) * v)
+
+        # Reserving {0, 1} values to stand-in for Sol, Earth respectively.
+        dist[n:] = [0.00, 1.00]
         
-        if 1.00 not in dist:
-            dist = append(dist, [1.00])
+        if (dist[:n] == 1.00).any():
+            dist = dist[:n + 1]
         
-        dist = absolute(dist).round(2)
+        absolute(dist, out=dist)
+        dist.round(2, out=dist)
         dist.sort()
 
         n += 1
@@ -70,14 +73,11 @@ class Cosmology:
         rgb = self.rng.integers(0, 255, size=(n, 3), endpoint=True)
         rgb[0] = array([255, 165, 0])
 
-        return [Luminary(distance=dist[i], visible=vis[i], rgb=rgb[i])
-                for i in range(n)]
+        return LuminaryTable(distance=dist[:n], visible=vis[:n], rgb=rgb)
     
-    def __generate_number(self) -> ndarray:
-        """Generate an initial array of important numbers."""
-        visible = len(list(filter(lambda l: l["visible"], self.luminary)))
-        
-        return array([visible])
+    def __generate_number(self) -> list[int]:
+        """Generate an initial list of important numbers."""
+        return [int(self.luminary.visible.sum())]
 
     @property
     def seed(self) -> int:
@@ -97,7 +97,7 @@ class Cosmology:
         None
 
         """
-        self.number = append(self.number, n)
+        self.number.append(n)
     
     def remove_number(self, n: int) -> None:
         """Remove a significant number from this instance.
@@ -112,7 +112,7 @@ class Cosmology:
         None
 
         """
-        self.number = self.number[self.number != n]
+        self.number = [x for x in self.number if x != n]
 
     def count_attribute(self, attribute: str) -> int:
         """Count of the items within the desired attribute.
@@ -129,7 +129,4 @@ class Cosmology:
         """
         attr = getattr(self, attribute.lower())
 
-        if isinstance(attr, list):
-            return len(attr)
-        else:
-            return attr.shape[0]
+        return len(attr)
@@ -1,12 +1,59 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from re import match
-from numpy import array, where
-from numpy.linalg import norm
+from numpy import argmin, array, asarray, empty, int32, int64
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 if TYPE_CHECKING:
+    from typing import Iterator
     from numpy import ndarray
 
+# Reference colors used to describe RGB values, paired by index with names.
+_PALETTE = array([[255, 165, 0], [255, 0, 0], [0, 255, 0], [0, 0, 255],
+                  [255, 255, 255]], dtype=int32)
+_PALETTE_NAMES = ("orange", "red", "green", "blue", "white")
+
+
+def _nearest_numpy(rgb: ndarray, palette: ndarray) -> ndarray:
+    """Index of the nearest `palette` row for each row of `rgb`."""
+    # Squared distances preserve the ordering, so no sqrt is needed.
+    diff = rgb[:, None, :] - palette
+
+    return argmin((diff * diff).sum(axis=2), axis=1)
+
+
+def _nearest_loop(rgb: ndarray, palette: ndarray) -> ndarray:
+    """Explicit-loop form of `_nearest_numpy`, written for numba."""
+    index = empty(rgb.shape[0], dtype=int64)
+
+    for i in range(rgb.shape[0]):
+        closest = 0
+        closest_distance = -1
+        for j in range(palette.shape[0]):
+            distance = 0
+            for k in range(rgb.shape[1]):
+                diff = rgb[i, k] - palette[j, k]
+                distance += diff * diff
+
+            if closest_distance < 0 or distance < closest_distance:
+                closest = j
+                closest_distance = distance
+
+        index[i] = closest
+
+    return index
+
+
+# Compiled eagerly for int32 inputs and cached, so no call pays a JIT compile.
+if njit is not None:
+    _assign_colors = njit("int64[:](int32[:, :], int32[:, :])",
+                          cache=True)(_nearest_loop)
+else:
+    _assign_colors = _nearest_numpy
+
 
 class Element:
     """
@@ -17,39 +64,64 @@ class Element:
     **associations :
         Assign any irreal associations to the Element via keyword arguments.
         They may subsequently be accessed (re-assigned, updated, etc.) as keys
-        from the Element itself (i.e., using `Element[key]`).
+        or attributes of the Element itself (i.e., using `Element[key]` or
+        `Element.key`).
 
     """
+    __slots__ = ("__association",)
+
+    # Names a subclass stores in its own slots rather than as associations.
+    _field: tuple[str, ...] = ()
+
+    # Name shown by `__repr__`; defaults to the class name.
+    _display_name: str | None = None
+
     def __init__(self, **associations) -> None:
-        for k, v in associations.items():
-            setattr(self, k, v)
+        self.__association = dict(associations)
     
     def __repr__(self) -> str:
-        def not_dunder(x):
-            return match("^_", x) is None
-        
-        attribute = dir(self)
-        if "name" in attribute:
-            other = filter(lambda x: x != "name" and not_dunder(x), attribute)
-            key = ["name"] + list(other)
+        association = {k: getattr(self, k) for k in self._field}
+        association.update(self.__association)
+        if "name" in association:
+            key = ["name"] + [k for k in association if k != "name"]
         else:
-            key = [k for k in attribute if not_dunder(k)]
-        
-        value = [getattr(self, k) for k in key]
-        index = [i for i in range(len(value)) if not callable(value[i])]
+            key = list(association)
 
-        text = []
-        for i in index:
-            template = "{}='{}'" if isinstance(value[i], str) else "{}={}"
-            text.append(template.format(key[i], value[i]))
+        text = [f"{k}={association[k]!r}" for k in key]
+        
+        name = self._display_name or self.__class__.__name__
         
-        return f"{self.__class__.__name__}({', '.join(text)})"
+        return f"{name}({', '.join(text)})"
     
+    def __getattr__(self, key: str) -> str | int | float | None:
+        # Only reached for names missing from the instance itself.
+        if key.startswith("_"):
+            raise AttributeError(key)
+
+        try:
+            return self.__association[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+    def __setattr__(self, key: str, value) -> None:
+        # Private names and fields keep normal assignment; any other name is
+        # an association, mirroring `__getattr__`.
+        if key.startswith("_") or key in self._field:
+            object.__setattr__(self, key, value)
+        else:
+            self.__association[key] = value
+
     def __getitem__(self, key: str) -> str | int | float | None:
-        return getattr(self, key)
+        if key in self._field:
+            return getattr(self, key)
+
+        return self.__association[key]
     
     def __setitem__(self, key, value) -> None:
-        setattr(self, key, value)
+        if key in self._field:
+            setattr(self, key, value)
+        else:
+            self.__association[key] = value
 
 
 class Luminary(Element):
@@ -67,6 +139,10 @@ class Luminary(Element):
 
     rgb : ndarray
         A 3-element array describing the Luminary's visible color as RGB values.
+
+    color : str, optional
+        A precomputed description of `rgb`. If omitted, it will be derived from
+        the `rgb` value.
     
     Attributes
     ----------
@@ -83,21 +159,136 @@ class Luminary(Element):
         A text description of the Luminary's RGB color.
     
     """
-    def __init__(self, distance: float, visible: bool, rgb: ndarray) -> None:
-        super().__init__(
-            distance=distance,
-            visible=visible,
-            rgb=rgb,
-            color=self.__describe_rgb(rgb)
-            )
+    __slots__ = _field = ("distance", "visible", "rgb", "color")
+
+    def __init__(self, distance: float, visible: bool, rgb: ndarray,
+                 color: str | None = None) -> None:
+        super().__init__()
+        self.distance = distance
+        self.visible = visible
+        self.rgb = rgb
+        self.color = self.__describe_rgb(rgb) if color is None else color
     
     def __describe_rgb(self, rgb: ndarray) -> str:
         """Describe a rgb value array as a string."""
-        name = ["orange", "red", "green", "blue", "white"]
-        value = array([[255, 165, 0],[255, 0, 0],[0, 255, 0],[0, 0, 255],
-                       [255, 255, 255]])
-
-        distance = norm(value - rgb, axis=1)
-        closest = where(distance == distance.min())[0][0]
+        index = _assign_colors(asarray(rgb, dtype=int32).reshape(1, 3),
+                               _PALETTE)
         
-        return name[closest]
+        return _PALETTE_NAMES[int(index[0])]
+
+
+class LuminaryTable:
+    """
+    A collection of Luminaries stored as parallel arrays.
+
+    Parameters
+    ----------
+    distance : ndarray
+        An n-element array of each Luminary's distance from the Sun in
+        astronomical units (AU).
+
+    visible : ndarray
+        An n-element boolean array of each Luminary's naked eye visibility.
+
+    rgb : ndarray
+        An (n, 3) array of each Luminary's visible color as RGB values.
+
+    Attributes
+    ----------
+    distance : ndarray
+        Each Luminary's distance from its Sun in astronomical units (AU).
+
+    visible : ndarray
+        Whether each Luminary is visible with the naked eye.
+
+    rgb : ndarray
+        The RGB color value each Luminary appears as in the night sky.
+
+    color : ndarray
+        A text description of each Luminary's RGB color.
+
+    Indexing the table returns Luminary views of its rows. Assigning to a
+    view's fields writes back to these arrays, and any other associations are
+    kept on the view, which is reused for every access to that row.
+
+    """
+    def __init__(self, distance: ndarray, visible: ndarray,
+                 rgb: ndarray) -> None:
+        self.distance = distance
+        self.visible = visible
+        self.rgb = rgb
+        self.color = self.__describe_rgb(rgb)
+        self.__row = [None] * len(self)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(n={len(self)})"
+
+    def __len__(self) -> int:
+        return self.distance.shape[0]
+
+    def __getitem__(
+            self, key: int | slice
+            ) -> _LuminaryRow | list[_LuminaryRow]:
+        if isinstance(key, slice):
+            return [self[i] for i in range(len(self))[key]]
+
+        index = range(len(self))[key]
+        row = self.__row[index]
+        if row is None:
+            row = self.__row[index] = _LuminaryRow(self, index)
+
+        return row
+
+    def __iter__(self) -> Iterator[_LuminaryRow]:
+        return (self[i] for i in range(len(self)))
+
+    def __describe_rgb(self, rgb: ndarray) -> ndarray:
+        """Describe each row of an (n, 3) rgb array as a string."""
+        index = _assign_colors(rgb.astype(int32), _PALETTE)
+
+        # Object dtype so that re-assigned names are never truncated.
+        return array(_PALETTE_NAMES, dtype=object)[index]
+
+
+class _LuminaryRow(Element):
+    """A Luminary whose fields read and write one row of a LuminaryTable."""
+    __slots__ = ("__table", "__index")
+    _field = Luminary._field
+    _display_name = "Luminary"
+
+    def __init__(self, table: LuminaryTable, index: int) -> None:
+        super().__init__()
+        self.__table = table
+        self.__index = index
+
+    @property
+    def distance(self) -> float:
+        return float(self.__table.distance[self.__index])
+
+    @distance.setter
+    def distance(self, value: float) -> None:
+        self.__table.distance[self.__index] = value
+
+    @property
+    def visible(self) -> bool:
+        return bool(self.__table.visible[self.__index])
+
+    @visible.setter
+    def visible(self, value: bool) -> None:
+        self.__table.visible[self.__index] = value
+
+    @property
+    def rgb(self) -> ndarray:
+        return self.__table.rgb[self.__index]
+
+    @rgb.setter
+    def rgb(self, value: ndarray) -> None:
+        self.__table.rgb[self.__index] = value
+
+    @property
+    def color(self) -> str:
+        return self.__table.color[self.__index]
+
+    @color.setter
+    def color(self, value: str) -> None:
+        self.__table.color[self.__index] = value
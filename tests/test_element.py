@@ -0,0 +1,33 @@
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from cosmology import element
+from cosmology.element import _PALETTE, _nearest_loop, _nearest_numpy
+
+
+@pytest.fixture
+def rgb():
+    return numpy.random.default_rng(0).integers(
+        0, 255, size=(256, 3), endpoint=True
+        ).astype(numpy.int32)
+
+
+def test_nearest_loop_matches_numpy(rgb):
+    expected = _nearest_numpy(rgb, _PALETTE)
+
+    assert (_nearest_loop(rgb, _PALETTE) == expected).all()
+
+
+def test_numba_kernel_matches_numpy(rgb):
+    if element.njit is None:
+        pytest.skip("numba is not installed")
+
+    expected = _nearest_numpy(rgb, _PALETTE)
+
+    assert (element._assign_colors(rgb, _PALETTE) == expected).all()
+
+
+def test_luminary_accepts_sequence_rgb():
+    assert element.Luminary(1.0, True, (250, 5, 5)).color == "red"
+    assert element.Luminary(1.0, True, [5, 5, 250]).color == "blue"
@@ -0,0 +1,54 @@
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from cosmology.element import LuminaryTable
+
+
+@pytest.fixture
+def table():
+    return LuminaryTable(
+        distance=numpy.array([0.0, 1.0, 12.5]),
+        visible=numpy.array([True, True, False]),
+        rgb=numpy.array([[255, 165, 0], [250, 10, 10], [10, 10, 250]])
+        )
+
+
+def test_colors_are_assigned(table):
+    assert list(table.color) == ["orange", "red", "blue"]
+
+
+def test_rows_are_cached(table):
+    assert table[0] is table[0]
+    assert table[-1] is table[2]
+
+
+def test_associations_persist(table):
+    table[0]["name"] = "Sol"
+    table[1].power = 3
+
+    assert table[0]["name"] == "Sol"
+    assert table[1]["power"] == 3
+    assert repr(table[0]).startswith("Luminary(name='Sol'")
+
+
+def test_fields_write_through(table):
+    table[0]["distance"] = 2.0
+    table[-1].visible = True
+    table[1].color = "crimson"
+
+    assert table.distance[0] == 2.0
+    assert table.visible[2]
+    assert table.color[1] == "crimson"
+
+
+def test_slice_returns_rows(table):
+    rows = table[1:]
+
+    assert rows == [table[1], table[2]]
+    assert [row.distance for row in rows] == [1.0, 12.5]
+
+
+def test_out_of_range_key(table):
+    with pytest.raises(IndexError):
+        table[3]